@@ -21,7 +21,6 @@ info = read_version_info("syzqemuctl/_version.py")
 REQUIRED = [
     'click',
     'rich',
-    'scp',
     'paramiko',
     'requests',
     'packaging',
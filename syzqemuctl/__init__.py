@@ -1,7 +1,7 @@
 from ._version import __title__, __version__, __description__, __author__, __email__, __license__, __url__
 from .config import global_conf
 from .image import ImageManager
-from .vm import VM, VMConfig
+from .vm import VM, VMConfig, VMState
 
-__all__ = ["global_conf", "ImageManager", "VM", "VMConfig"]
+__all__ = ["global_conf", "ImageManager", "VM", "VMConfig", "VMState"]
 
@@ -1,7 +1,6 @@
 import os
 import click
 from rich.console import Console
-from rich.table import Table
 from datetime import datetime
 from typing import Optional
 
@@ -112,6 +111,7 @@ def status(name: str):
         return
     manager = ImageManager(global_conf.images_home, verbose=True)
     if info := manager.get_image_info(name):
+        from rich.table import Table
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Property")
         table.add_column("Value")
@@ -134,21 +134,21 @@ def status(name: str):
 
         # Show running status
         creation_screen = f"{__title__}-{name}-creation"
+        vm = VM(str(info.path), verbose=True)
         if utils.check_screen_exists(creation_screen):
             table.add_row("Status", "[yellow]Creating[/yellow]")
-        elif info.running:
-            vm = VM(str(info.path), verbose=True)
-            if vm.is_ready():
+        elif (state := vm.snapshot()).running:
+            if state.ready:
                 table.add_row("Status", "[green]Running[/green]")
             else:
                 table.add_row("Status", "[yellow]Starting[/yellow]")
 
-            if vm_conf := vm.get_last_vm_config():
+            if vm_conf := state.config:
                 table.add_row("Kernel", vm_conf.kernel)
                 table.add_row("SSH Port", str(vm_conf.port))
                 table.add_row("Memory", vm_conf.memory)
                 table.add_row("CPU Cores", str(vm_conf.smp))
-            table.add_row("PID", str(info.pid))
+            table.add_row("PID", str(state.pid))
             table.add_row("Console", f"screen -r {vm.screen_name}")
         else:
             table.add_row("Status", "[yellow]Not Running[/yellow]")
@@ -196,6 +196,7 @@ def list():
         return
         
     # Create table for all images
+    from rich.table import Table
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Name")
     table.add_column("Created At")
@@ -263,7 +264,8 @@ def run(name: str, kernel: str, port: int, mem: str, smp: int, snapshot: bool):
         return
         
     # Check if already running
-    if info.running:
+    vm = VM(str(info.path), verbose=True)
+    if vm.snapshot(probe=False).running:
         console.print(f"[red]Error: Image {name} is already running[/red]")
         return
 
@@ -272,8 +274,7 @@ def run(name: str, kernel: str, port: int, mem: str, smp: int, snapshot: bool):
         console.print(f"[red]Error: Image {name} is not ready yet[/red]")
         return
 
-    # Create VM instance and start
-    vm = VM(str(info.path), verbose=True)
+    # Start VM
     if vm.start(kernel, port, mem, smp, snapshot):
         console.print("[green]Starting VM... SSH will be available soon[/green]")
         console.print(f"Use '{__title__} status {name}' or check console for status")
@@ -292,11 +293,11 @@ def stop(name: str):
         console.print(f"[red]Error: Image {name} not found[/red]")
         return
         
-    if not info.running:
+    vm = VM(str(info.path), verbose=True)
+    if not vm.snapshot(probe=False).running:
         console.print(f"[yellow]Warning: Image {name} is not running[/yellow]")
         return
         
-    vm = VM(str(info.path), verbose=True)
     if vm.stop():
         console.print("[green]VM stopped[/green]")
     else:
@@ -373,13 +374,14 @@ def cp(src: str, dst: str):
         console.print(f"[red]Error: Image {image_name} is not ready yet[/red]")
         return
 
-    if not info.running:
+    vm = VM(str(info.path), verbose=True)
+    state = vm.snapshot()
+    if not state.running:
         console.print(f"[red]Error: Image {image_name} is not running[/red]")
         return
 
     # Handle file transfer
-    vm = VM(str(info.path), verbose=True)
-    if not vm.is_ready():
+    if not state.ready:
         console.print(f"[yellow]Error: Image {image_name} is starting, please wait[/yellow]")
         return
         
@@ -415,13 +417,17 @@ def exec(name: str, command: str):
         console.print(f"[red]Error: Image {name} is not ready yet[/red]")
         return
 
-    if not info.running:
+    vm = VM(str(info.path), verbose=True)
+    state = vm.snapshot()
+    if not state.running:
         console.print(f"[red]Error: Image {name} is not running[/red]")
         return
 
+    if not state.ready:
+        console.print(f"[yellow]Error: Image {name} is starting, please wait[/yellow]")
+        return
+
     # Execute command
-    vm = VM(str(info.path), verbose=True)
-        
     with vm:
         try:
             stdout, stderr = vm.execute(command)
@@ -1,9 +1,8 @@
 import os
 import shutil
-import requests
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 from . import utils
 from . import __title__
@@ -233,7 +232,10 @@ class ImageManager:
         path = self.images_home / name
         if not path.exists():
             return None
+        return self._build_image_info(name, path, path.stat().st_ctime)
 
+    def _build_image_info(self, name: str, path: Path, created_at: float) -> ImageInfo:
+        """Build image information for an existing image directory"""
         # Check running status
         pid_file = path / "vm.pid"
         pid = None
@@ -254,7 +256,7 @@ class ImageManager:
         return ImageInfo(
             name=name,
             path=path,
-            created_at=path.stat().st_ctime,
+            created_at=created_at,
             running=running,
             is_template=is_template,
             is_cache=is_cache,
@@ -262,16 +264,24 @@ class ImageManager:
             pid=pid
         )
 
+    def _scan_images(self) -> Dict[str, os.stat_result]:
+        """Scan images home once, return stat result of each image directory"""
+        images = {}
+        try:
+            with os.scandir(self.images_home) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not entry.name.startswith("."):
+                        images[entry.name] = entry.stat()
+        except FileNotFoundError:
+            pass
+        return images
+
     def list_images(self) -> List[ImageInfo]:
         """List all images, including template and cache templates"""
-        if not self.images_home.exists():
-            return []
-
-        images = []
-        for path in self.images_home.iterdir():
-            if path.is_dir() and not path.name.startswith("."):
-                if info := self.get_image_info(path.name):
-                    images.append(info)
+        images = [
+            self._build_image_info(name, self.images_home / name, st.st_ctime)
+            for name, st in self._scan_images().items()
+        ]
 
         # Sort: main template first, then cache templates by name, then user images by creation time
         return sorted(images, key=lambda x: (
@@ -1,8 +1,7 @@
-import requests
-from packaging import version
 from typing import Optional, Tuple
 from functools import lru_cache
 import os
+import select
 import signal
 import time
 import subprocess
@@ -43,6 +42,7 @@ def check_latest_version() -> Tuple[Optional[str], Optional[str]]:
         pass
 
     try:
+        import requests
         response = requests.get(f"https://pypi.org/pypi/{__title__}/json", timeout=1)
         if response.status_code == 200:
             latest_version = response.json()["info"]["version"]
@@ -56,6 +56,7 @@ def check_latest_version() -> Tuple[Optional[str], Optional[str]]:
 def needs_update(current: str, latest: str) -> bool:
     """Check if update is needed"""
     try:
+        from packaging import version
         return version.parse(latest) > version.parse(current)
     except Exception:
         return False
@@ -78,6 +79,7 @@ def download_file(url: str, target_path: str, executable: bool = False) -> None:
         executable: Set executable permission
     """
     try:
+        import requests
         response = requests.get(url, proxies=get_proxy_settings(), timeout=10)
         response.raise_for_status()
         
@@ -102,6 +104,23 @@ def wait_for_process_end(pid: int, timeout: float = 5.0, check_interval: float =
     Returns:
         bool: Whether process has ended
     """
+    # Prefer a pidfd (Linux 5.3+, Python 3.9+), which becomes readable the moment the process exits
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            fd = pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            fd = None
+        if fd is not None:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                return bool(poller.poll(int(timeout * 1000)))
+            finally:
+                os.close(fd)
+
     end_time = time.time() + timeout
     while time.time() < end_time:
         try:
@@ -1,9 +1,15 @@
 import os
+import posixpath
 import re
+import random
+import select
+import socket
+import stat
 import signal
 import subprocess
 import logging
-import paramiko
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 def set_paramiko_logging(level: int = logging.CRITICAL) -> None:
@@ -15,13 +21,36 @@ def set_paramiko_logging(level: int = logging.CRITICAL) -> None:
 set_paramiko_logging(logging.CRITICAL)
 
 from dataclasses import dataclass
-from typing import Optional, Tuple
-from scp import SCPClient
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 import time
 
 from . import __title__
 from . import utils
 
+# paramiko pulls in cryptography, import it only when SSH is actually used
+if TYPE_CHECKING:
+    import paramiko
+
+# Extract config from qemu command line args in boot.sh with a single pass,
+# each arg starts its own line as written by VM._generate_boot_script
+_BOOT_RE = re.compile(
+    r'^[ \t]*-kernel[ \t]+(?P<kernel>\S+)/arch/x86'
+    r'|hostfwd=tcp::(?P<port>\d+)-:22'
+    r'|^[ \t]*-m[ \t]+(?P<memory>\S+)'
+    r'|^[ \t]*-smp[ \t]+(?P<smp>\S+)',
+    re.ASCII | re.MULTILINE
+)
+# Unanchored variant for hand-edited scripts that put several args on one line
+_BOOT_FALLBACK_RE = re.compile(
+    r'-kernel (?P<kernel>\S+)/arch/x86'
+    r'|hostfwd=tcp::(?P<port>\d+)-:22'
+    r'|-m (?P<memory>\S+)'
+    r'|-smp (?P<smp>\S+)',
+    re.ASCII
+)
+# boot.sh is a few hundred bytes, never read more than this
+_BOOT_SCRIPT_MAX_READ = 64 * 1024
+
 @dataclass
 class VMConfig:
     """Virtual machine configuration"""
@@ -36,34 +65,83 @@ class VMConfig:
     
     @classmethod
     def from_boot_script(cls, script_path: Path) -> Optional["VMConfig"]:
-        """Parse configuration from boot script"""
-        if not script_path.exists():
-            return None
-            
+        """Parse configuration from boot script (cached until the script changes)"""
         try:
-            content = script_path.read_text()
-            # Extract config from qemu command line args
-            kernel_match = re.search(r'-kernel ([^\s]+)/arch/x86', content)
-            port_match = re.search(r'hostfwd=tcp::(\d+)-:22', content)
-            mem_match = re.search(r'-m ([^\s]+)', content)
-            smp_match = re.search(r'-smp ([^\s]+)', content)
-            
-            if not all([kernel_match, port_match]):
-                return None
-                
-            return cls(
-                kernel=kernel_match.group(1),
-                port=int(port_match.group(1)),
-                memory=mem_match.group(1) if mem_match else cls.DEFAULT_MEM,
-                smp=int(smp_match.group(1)) if smp_match else cls.DEFAULT_SMP
-            )
-        except Exception:
+            st = script_path.stat()
+        except OSError:
             return None
+        # Build a fresh instance each time, callers may modify what they get back
+        if args := _parse_boot_script(str(script_path), st.st_mtime_ns, st.st_size):
+            return cls(*args)
+        return None
+
+@lru_cache(maxsize=512)
+def _parse_boot_script(path: str, mtime_ns: int, size: int) -> Optional[Tuple[str, int, str, int]]:
+    """Parse boot script content into (kernel, port, memory, smp)
+    Keyed by (path, mtime, size) so edits invalidate the cache
+    """
+    try:
+        with open(path) as f:
+            content = f.read(_BOOT_SCRIPT_MAX_READ)
+        for pattern in (_BOOT_RE, _BOOT_FALLBACK_RE):
+            args = {}
+            for m in pattern.finditer(content):
+                args.setdefault(m.lastgroup, m[m.lastgroup])
+            if "kernel" in args and "port" in args:
+                break
+        else:
+            return None
+
+        return (
+            args["kernel"],
+            int(args["port"]),
+            args.get("memory", VMConfig.DEFAULT_MEM),
+            int(args.get("smp", VMConfig.DEFAULT_SMP))
+        )
+    except Exception:
+        return None
+
+@dataclass
+class VMState:
+    """Virtual machine state at a point in time"""
+    pid: Optional[int]
+    config: Optional[VMConfig]
+    ready: bool = False
+
+    @property
+    def running(self) -> bool:
+        return self.pid is not None
+
+# Live SSH clients shared by all VM instances, keyed by (port, username, key_file)
+_SSH_POOL: Dict[Tuple[int, str, str], "paramiko.SSHClient"] = {}
+_SSH_POOL_LOCK = threading.Lock()
+
+def _evict_ssh(client: "paramiko.SSHClient") -> None:
+    """Remove a broken SSH client from the pool, closing it only if its transport is already dead
+    Other VM instances may still hold a live client, so it is never closed under them
+    """
+    with _SSH_POOL_LOCK:
+        for key, pooled in list(_SSH_POOL.items()):
+            if pooled is client:
+                del _SSH_POOL[key]
+    transport = client.get_transport()
+    if not (transport and transport.is_active()):
+        client.close()
+
+def _close_pooled_ssh(port: int) -> None:
+    """Close and remove all pooled SSH clients of the VM forwarded on port"""
+    with _SSH_POOL_LOCK:
+        clients = [_SSH_POOL.pop(key) for key in list(_SSH_POOL) if key[0] == port]
+    for client in clients:
+        client.close()
 
 class VM:
     """Virtual machine manager for running, stopping, and SSH operations"""
     PORT_START = 20000
     PORT_END = 30000
+    PORT_PICK_ATTEMPTS = 100
+    SSH_WINDOW_SIZE = 4 * 1024 * 1024
+    EXEC_RECV_SIZE = 32768
     
     def __init__(self, image_path: str, verbose: bool = False):
         self.image_path = Path(image_path)
@@ -72,48 +150,132 @@ class VM:
         self.boot_script = self.image_path / "boot.sh"
         self.screen_name = f"{__title__}-{self.image_path.name}"
         self.verbose = verbose
+        # (st_mtime_ns, st_size, pid) of the last parsed pid file
+        self._pid_cache: Optional[Tuple[int, int, int]] = None
 
         # SSH related attributes
         self._ssh = None
-        self._scp = None
+        self._sftp = None
         self._key_file = self.image_path / "bullseye.id_rsa"
+
+    def _ssh_pool_key(self, port: int, username: str = "root") -> Tuple[int, str, str]:
+        """Key of this VM's SSH client in the pool"""
+        return (port, username, str(self._key_file))
+
+    def _get_ssh(self, username: str = "root", timeout: float = 15) -> Optional["paramiko.SSHClient"]:
+        """Get a live SSH client from the pool, connecting only if none is active"""
+        import paramiko
+
+        vm_conf = self.get_last_vm_config()
+        if not vm_conf:
+            return None
+
+        key = self._ssh_pool_key(vm_conf.port, username)
+        with _SSH_POOL_LOCK:
+            if client := self._pooled_ssh(key):
+                return client
+
+        # Connect outside the lock so a slow guest does not block other VMs
+        sock = socket.create_connection(("localhost", vm_conf.port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            # Only the image key is used, skip agent, ~/.ssh and GSSAPI lookups
+            client.connect(
+                hostname="localhost",
+                port=vm_conf.port,
+                username=username,
+                key_filename=str(self._key_file),
+                sock=sock,
+                timeout=timeout,
+                banner_timeout=timeout,
+                auth_timeout=timeout,
+                allow_agent=False,
+                look_for_keys=False,
+                gss_auth=False,
+                gss_kex=False,
+            )
+        except Exception:
+            client.close()
+            sock.close()
+            raise
+        # Keep idle connections alive between exec calls, and use a larger
+        # channel window so big outputs need fewer window adjust round trips
+        transport = client.get_transport()
+        transport.set_keepalive(30)
+        transport.default_window_size = self.SSH_WINDOW_SIZE
+
+        with _SSH_POOL_LOCK:
+            # Another thread may have connected meanwhile, keep a single client per key
+            if pooled := self._pooled_ssh(key):
+                client.close()
+                return pooled
+            _SSH_POOL[key] = client
+            return client
+
+    @staticmethod
+    def _pooled_ssh(key: Tuple[int, str, str]) -> Optional["paramiko.SSHClient"]:
+        """Get the live pooled client for key, dropping a dead one. Caller holds _SSH_POOL_LOCK"""
+        if client := _SSH_POOL.get(key):
+            transport = client.get_transport()
+            if transport and transport.is_active():
+                return client
+            del _SSH_POOL[key]
+            client.close()
+        return None
         
+    @staticmethod
+    def _port_is_free(port: int) -> bool:
+        """Check if the kernel lets us bind a TCP port, as qemu hostfwd will"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("", port))
+                return True
+            except OSError:
+                return False
+
+    @staticmethod
+    def _inspect_sibling(path: str) -> Optional[int]:
+        """Get SSH port of the VM at path if it is running"""
+        if not os.path.exists(os.path.join(path, "vm.pid")):
+            return None
+        vm = VM(path)
+        if vm.is_running() and (vm_conf := vm.get_last_vm_config()):
+            return vm_conf.port
+        return None
+
     def _find_available_port(self) -> Optional[int]:
         """Find an available port"""
         try:
-            # Get all used ports using netstat
-            result = subprocess.run(
-                ["netstat", "-tuln"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            # Parse used ports
+            # Get ports used by other running VMs, only siblings with a pid file can be running
             used_ports = set()
-            for line in result.stdout.splitlines():
-                if "LISTEN" in line:
-                    if match := re.search(r':(\d+)\s', line):
-                        used_ports.add(int(match.group(1)))
-                        
-            # Get ports used by other running VMs
-            for path in self.image_path.parent.iterdir():
-                if path.is_dir():
-                    vm = VM(str(path))
-                    if vm_conf := vm.get_last_vm_config():
-                        if vm.is_running():
-                            used_ports.add(vm_conf.port)
-                            
+            with os.scandir(self.image_path.parent) as entries:
+                siblings = [entry.path for entry in entries
+                            if entry.is_dir() and entry.path != str(self.image_path)]
+            if len(siblings) > 1:
+                # Sibling checks are independent file reads, fan them out
+                from concurrent.futures import ThreadPoolExecutor, as_completed
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = [executor.submit(self._inspect_sibling, path) for path in siblings]
+                    ports = [future.result() for future in as_completed(futures)]
+            else:
+                ports = [self._inspect_sibling(path) for path in siblings]
+            used_ports.update(port for port in ports if port is not None)
+
             # First try last used port
             if last_vm_conf := self.get_last_vm_config():
-                if last_vm_conf.port not in used_ports:
+                if last_vm_conf.port not in used_ports and self._port_is_free(last_vm_conf.port):
                     return last_vm_conf.port
-                    
-            # Find new available port
-            for port in range(self.PORT_START, self.PORT_END):
-                if port not in used_ports:
+
+            # Let the kernel tell which random candidates are free
+            for _ in range(self.PORT_PICK_ATTEMPTS):
+                port = random.randrange(self.PORT_START, self.PORT_END)
+                if port not in used_ports and self._port_is_free(port):
                     return port
-                    
-        except subprocess.SubprocessError:
+
+        except OSError:
             pass
         return None
         
@@ -139,6 +301,12 @@ exec qemu-system-x86_64 \\
  -smp {vm_conf.smp} \\
  -pidfile {self.pid_file}
 """
+        # Keep an identical script untouched so its mtime (and the parsed config cache) stays valid
+        try:
+            if self.boot_script.read_text() == script_content:
+                return
+        except OSError:
+            pass
         self.boot_script.write_text(script_content)
         self.boot_script.chmod(0o755)
         
@@ -181,12 +349,15 @@ exec qemu-system-x86_64 \\
                 check=True
             )
 
-            # Wait for PID file and process readiness (max 30 seconds)
+            # Wait for PID file and process readiness (max 30 seconds),
+            # qemu writes the pid file right after launch so poll tightly first
             deadline = time.time() + 30
+            delay = 0.01
             while time.time() < deadline:
-                if self.pid_file.exists() and self.is_running():
+                if self.is_running():
                     break
-                time.sleep(0.1)
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
             else:
                 raise RuntimeError("Failed to start VM: PID file not generated")
 
@@ -217,15 +388,17 @@ exec qemu-system-x86_64 \\
         # Disconnect SSH first (best-effort, non-blocking)
         try:
             self.disconnect()
+            # The guest is going away, so pooled connections to it are too
+            if vm_conf := self.get_last_vm_config():
+                _close_pooled_ssh(vm_conf.port)
         except Exception:
             pass
 
         killed = False
-        if self.pid_file.exists():
+        if (pid := self._read_pid()) is not None:
             try:
-                pid = int(self.pid_file.read_text().strip())
                 killed = utils.kill_process(pid)
-            except (ValueError, OSError):
+            except OSError:
                 pass
 
         # Always clean up screen session
@@ -248,47 +421,95 @@ exec qemu-system-x86_64 \\
 
         return killed or screen_cleaned or not was_running
             
+    def _read_pid(self) -> Optional[int]:
+        """Read pid from pid file, reusing the last parsed value while the file is unchanged"""
+        try:
+            st = os.stat(self.pid_file)
+            if self._pid_cache and self._pid_cache[:2] == (st.st_mtime_ns, st.st_size):
+                return self._pid_cache[2]
+            with open(self.pid_file) as f:
+                pid = int(f.read().strip())
+        except (ValueError, OSError):
+            return None
+        self._pid_cache = (st.st_mtime_ns, st.st_size, pid)
+        return pid
+
+    def _live_pid(self) -> Optional[int]:
+        """Get pid of the VM process if it is alive"""
+        if (pid := self._read_pid()) is None:
+            return None
+        try:
+            os.kill(pid, 0)
+            return pid
+        except OSError:
+            return None
+
     def is_running(self) -> bool:
         """Check if VM is running"""
-        try:
-            return self.pid_file.exists() and os.kill(int(self.pid_file.read_text().strip()), 0) is None
-        except (ValueError, ProcessLookupError, OSError):
-            return False
+        return self._live_pid() is not None
             
     def is_ready(self) -> bool:
         """Check if VM is fully started (SSH available)"""
-        if not self.is_running():
+        return self.is_running() and self._probe_ssh()
+
+    def snapshot(self, probe: bool = True) -> VMState:
+        """Get pid, last boot config and SSH readiness of VM in one go
+        Args:
+            probe: Probe SSH readiness if VM is running
+        """
+        pid = self._live_pid()
+        config = self.get_last_vm_config()
+        ready = probe and pid is not None and config is not None and self._probe_ssh()
+        return VMState(pid=pid, config=config, ready=ready)
+
+    @staticmethod
+    def _sshd_answering(port: int, timeout: float = 2.0) -> bool:
+        """Check if sshd in VM sends its banner on the forwarded port, without an SSH handshake"""
+        try:
+            with socket.create_connection(("localhost", port), timeout=timeout) as sock:
+                # qemu user networking accepts on the host before the guest listens, so wait for the banner
+                return sock.recv(4).startswith(b"SSH")
+        except OSError:
             return False
-            
+
+    def _probe_ssh(self) -> bool:
+        """Check if SSH in VM accepts connections"""
+        vm_conf = self.get_last_vm_config()
+        if not vm_conf:
+            return False
+
+        # Until a pooled client exists, a cheap TCP probe rules out a VM that is still booting
+        with _SSH_POOL_LOCK:
+            pooled = self._ssh_pool_key(vm_conf.port) in _SSH_POOL
+        if not pooled and not self._sshd_answering(vm_conf.port):
+            return False
+
+        ssh = None
         try:
-            vm_conf = self.get_last_vm_config()
-            if not vm_conf:
+            ssh = self._get_ssh(timeout=5)
+            if not ssh:
                 return False
-                
-            # Try SSH connection
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(
-                hostname="localhost",
-                port=vm_conf.port,
-                username="root",
-                key_filename=str(self._key_file),
-                timeout=5,
-                banner_timeout=5,
-                auth_timeout=5,
-            )
-            ssh.close()
+
+            # Opening a channel needs a reply from the guest's sshd, so a hung or
+            # crashed guest is caught, while a pooled transport skips the handshake
+            ssh.get_transport().open_session(timeout=5).close()
             return True
         except Exception:
+            if ssh:
+                _evict_ssh(ssh)
             return False
             
     def wait_until_ready(self, timeout: int = 120, interval: int = 3) -> bool:
-        """Wait for VM to be fully started, return False on timeout"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        """Wait for VM to be fully started, return False on timeout
+        Probes back off exponentially from 0.5s up to `interval` seconds
+        """
+        deadline = time.time() + timeout
+        delay = 0.5
+        while time.time() < deadline:
             if self.is_ready():
                 return True
-            time.sleep(interval)
+            time.sleep(max(0, min(delay, deadline - time.time())))
+            delay = min(delay * 2, interval)
         return False
             
     def connect(self, username: str = "root") -> bool:
@@ -306,22 +527,10 @@ exec qemu-system-x86_64 \\
             return False
             
         try:
-            vm_conf = self.get_last_vm_config()
-            if not vm_conf:
+            self._ssh = self._get_ssh(username)
+            if not self._ssh:
                 print("Failed to get VM config")
                 return False
-                
-            self._ssh = paramiko.SSHClient()
-            self._ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            self._ssh.connect(
-                hostname="localhost",
-                port=vm_conf.port,
-                username=username,
-                key_filename=str(self._key_file),
-                timeout=15,
-                banner_timeout=10,
-                auth_timeout=10,
-            )
             return True
         except Exception as e:
             print(f"Failed to connect to VM: {e}")
@@ -329,16 +538,20 @@ exec qemu-system-x86_64 \\
             
     def disconnect(self) -> None:
         """Disconnect from VM"""
-        if self._ssh:
-            self._ssh.close()
-            self._ssh = None
+        if self._sftp:
+            self._sftp.close()
+            self._sftp = None
+        # The SSH client is shared through the pool, only release this instance's reference
+        self._ssh = None
             
     def execute(self, command: str, silent: bool = False) -> Tuple[str, str]:
         """Execute command in VM"""
         if not self._ssh:
             raise RuntimeError("Not connected to VM")
             
-        stdin, stdout, stderr = self._ssh.exec_command(command)
+        channel = self._ssh.get_transport().open_session()
+        channel.settimeout(None)
+        channel.exec_command(command)
 
         def safe_decode(data):
             try:
@@ -349,26 +562,112 @@ exec qemu-system-x86_64 \\
                 except UnicodeDecodeError:
                     return data.decode('utf-8', errors='replace')
 
-        if not silent:
-            return safe_decode(stdout.read()), safe_decode(stderr.read())
-        else:
+        if silent:
             return None, None
+
+        # Drain stdout and stderr together so a full stderr window cannot stall stdout
+        stdout, stderr = bytearray(), bytearray()
+
+        def drain():
+            while channel.recv_ready():
+                stdout.extend(channel.recv(self.EXEC_RECV_SIZE))
+            while channel.recv_stderr_ready():
+                stderr.extend(channel.recv_stderr(self.EXEC_RECV_SIZE))
+
+        # After EOF the channel stays readable for select, so only select until then
+        while not channel.eof_received:
+            select.select([channel], [], [], 1.0)
+            drain()
+            if channel.exit_status_ready() and not channel.recv_ready() and not channel.recv_stderr_ready():
+                break
+        drain()
+        # No more output can arrive, block until the command exits (e.g. it redirected its output)
+        channel.recv_exit_status()
+        channel.close()
+        return safe_decode(bytes(stdout)), safe_decode(bytes(stderr))
         
-    def copy_to_vm(self, local_path: str, remote_path: str) -> None:
-        """Copy file to VM"""
+    def _sftp_client(self) -> "paramiko.SFTPClient":
+        """Get the SFTP client of current connection, created on first use"""
         if not self._ssh:
             raise RuntimeError("Not connected to VM")
-            
-        with SCPClient(self._ssh.get_transport()) as scp:
-            scp.put(local_path, remote_path, recursive=True)
+
+        if not self._sftp:
+            self._sftp = self._ssh.open_sftp()
+        return self._sftp
+
+    @staticmethod
+    def _sftp_is_dir(sftp: "paramiko.SFTPClient", path: str) -> bool:
+        """Check if remote path is an existing directory"""
+        try:
+            return stat.S_ISDIR(sftp.stat(path).st_mode)
+        except IOError:
+            return False
+
+    @staticmethod
+    def _sftp_put_file(sftp: "paramiko.SFTPClient", local_path: str, remote_path: str) -> None:
+        """Upload a file keeping its mode, as scp does (binaries must stay executable)"""
+        sftp.put(local_path, remote_path)
+        sftp.chmod(remote_path, stat.S_IMODE(os.stat(local_path).st_mode))
+
+    @staticmethod
+    def _sftp_get_tree(sftp: "paramiko.SFTPClient", remote_path: str, local_path: str, mode: Optional[int] = None) -> None:
+        """Download remote file or directory tree, keeping file modes as scp does"""
+        if mode is None:
+            mode = sftp.stat(remote_path).st_mode
+        if not stat.S_ISDIR(mode):
+            sftp.get(remote_path, local_path)
+            os.chmod(local_path, stat.S_IMODE(mode))
+            return
+
+        created = not os.path.isdir(local_path)
+        os.makedirs(local_path, exist_ok=True)
+        for attr in sftp.listdir_attr(remote_path):
+            child_path = posixpath.join(remote_path, attr.filename)
+            child_mode = attr.st_mode
+            # listdir_attr comes from lstat, follow links like scp -r does and skip dangling ones
+            if stat.S_ISLNK(child_mode):
+                try:
+                    child_mode = sftp.stat(child_path).st_mode
+                except IOError:
+                    continue
+            VM._sftp_get_tree(sftp, child_path, os.path.join(local_path, attr.filename), child_mode)
+        # Set directory mode after filling it, a read-only mode would block the copy
+        if created:
+            os.chmod(local_path, stat.S_IMODE(mode))
+        
+    def copy_to_vm(self, local_path: str, remote_path: str) -> None:
+        """Copy file or directory to VM"""
+        sftp = self._sftp_client()
+        # Same as scp -r: "dir/" copies its contents into remote_path, while a file
+        # or "dir" is copied into remote_path if it is an existing directory
+        copy_contents = os.path.isdir(local_path) and local_path.endswith(("/", os.sep))
+        if not copy_contents and self._sftp_is_dir(sftp, remote_path):
+            remote_path = posixpath.join(remote_path, os.path.basename(os.path.normpath(local_path)))
+
+        if not os.path.isdir(local_path):
+            self._sftp_put_file(sftp, local_path, remote_path)
+            return
+
+        created_dirs = []
+        for root, _, files in os.walk(local_path):
+            rel_path = os.path.relpath(root, local_path)
+            remote_root = remote_path if rel_path == "." else posixpath.join(remote_path, *rel_path.split(os.sep))
+            if not self._sftp_is_dir(sftp, remote_root):
+                sftp.mkdir(remote_root)
+                created_dirs.append((root, remote_root))
+            for name in files:
+                self._sftp_put_file(sftp, os.path.join(root, name), posixpath.join(remote_root, name))
+        # Set directory modes deepest first once filled, a read-only mode would block the copy
+        for root, remote_root in reversed(created_dirs):
+            sftp.chmod(remote_root, stat.S_IMODE(os.stat(root).st_mode))
             
     def copy_from_vm(self, remote_path: str, local_path: str) -> None:
-        """Copy file from VM"""
-        if not self._ssh:
-            raise RuntimeError("Not connected to VM")
-            
-        with SCPClient(self._ssh.get_transport()) as scp:
-            scp.get(remote_path, local_path, recursive=True)
+        """Copy file or directory from VM"""
+        sftp = self._sftp_client()
+        # Same as scp -r: copy into local_path if it is an existing directory
+        if os.path.isdir(local_path):
+            local_path = os.path.join(local_path, posixpath.basename(remote_path.rstrip("/")))
+        self._sftp_get_tree(sftp, remote_path, local_path)
             
     def __enter__(self):
         self.connect()